@@ -19,6 +19,10 @@ def pg_cur(pg):
             yield cur
 
 
+def mb(size_bytes: int) -> str:
+    return f"{size_bytes / (1024 * 1024):.1f} MB"
+
+
 # Periodically check that all backpressure lags are below the configured threshold,
 # assert if they are not.
 # If the check query fails, stop the thread. Main thread should notice that and stop the test.
@@ -44,26 +48,30 @@ def check_backpressure(pg: Postgres, stop_event: threading.Event, polling_interv
         log.info(f"max_replication_apply_lag: {max_replication_apply_lag_bytes} bytes")
 
     with pg_cur(pg) as cur:
+        # Parse and plan the lag query once, every poll only executes it
+        cur.execute('''
+        prepare backpressure_lags as
+        select pg_wal_lsn_diff(pg_current_wal_flush_lsn(),received_lsn) as received_lsn_lag,
+        pg_wal_lsn_diff(pg_current_wal_flush_lsn(),disk_consistent_lsn) as disk_consistent_lsn_lag,
+        pg_wal_lsn_diff(pg_current_wal_flush_lsn(),remote_consistent_lsn) as remote_consistent_lsn_lag
+        from backpressure_lsns();
+        ''')
+
         while not stop_event.is_set():
             try:
-                cur.execute('''
-                select pg_wal_lsn_diff(pg_current_wal_flush_lsn(),received_lsn) as received_lsn_lag,
-                pg_wal_lsn_diff(pg_current_wal_flush_lsn(),disk_consistent_lsn) as disk_consistent_lsn_lag,
-                pg_wal_lsn_diff(pg_current_wal_flush_lsn(),remote_consistent_lsn) as remote_consistent_lsn_lag,
-                pg_size_pretty(pg_wal_lsn_diff(pg_current_wal_flush_lsn(),received_lsn)),
-                pg_size_pretty(pg_wal_lsn_diff(pg_current_wal_flush_lsn(),disk_consistent_lsn)),
-                pg_size_pretty(pg_wal_lsn_diff(pg_current_wal_flush_lsn(),remote_consistent_lsn))
-                from backpressure_lsns();
-                ''')
+                cur.execute("execute backpressure_lags")
 
                 res = cur.fetchone()
                 received_lsn_lag = res[0]
                 disk_consistent_lsn_lag = res[1]
                 remote_consistent_lsn_lag = res[2]
 
-                log.info(f"received_lsn_lag = {received_lsn_lag} ({res[3]}), "
-                         f"disk_consistent_lsn_lag = {disk_consistent_lsn_lag} ({res[4]}), "
-                         f"remote_consistent_lsn_lag = {remote_consistent_lsn_lag} ({res[5]})")
+                # Pretty-print on our side to keep the polled node free of extra work
+                log.info(f"received_lsn_lag = {received_lsn_lag} ({mb(received_lsn_lag)}), "
+                         f"disk_consistent_lsn_lag = {disk_consistent_lsn_lag} "
+                         f"({mb(disk_consistent_lsn_lag)}), "
+                         f"remote_consistent_lsn_lag = {remote_consistent_lsn_lag} "
+                         f"({mb(remote_consistent_lsn_lag)})")
 
                 # Since feedback from pageserver is not immediate, we should allow some lag overflow
                 lag_overflow = 5 * 1024 * 1024  # 5MB
@@ -75,7 +83,7 @@ def check_backpressure(pg: Postgres, stop_event: threading.Event, polling_interv
                 if max_replication_apply_lag_bytes > 0:
                     assert remote_consistent_lsn_lag < max_replication_apply_lag_bytes + lag_overflow
 
-                time.sleep(polling_interval)
+                stop_event.wait(polling_interval)
 
             except Exception as e:
                 log.info(f"backpressure check query failed: {e}")
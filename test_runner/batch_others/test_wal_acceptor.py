@@ -123,7 +123,7 @@ def test_many_timelines(neon_env_builder: NeonEnvBuilder):
             try:
                 while not self.should_stop.is_set():
                     collect_metrics("during INSERT INTO")
-                    time.sleep(1)
+                    self.should_stop.wait(1)
             except:
                 log.error("MetricsChecker's thread failed, the test will be failed on .stop() call",
                           exc_info=True)
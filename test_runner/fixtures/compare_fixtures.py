@@ -1,5 +1,5 @@
 import pytest
-from contextlib import contextmanager
+from contextlib import closing, contextmanager
 from abc import ABC, abstractmethod
 from fixtures.pg_stats import PgStatTable
 
@@ -66,14 +66,15 @@ class PgCompare(ABC):
     def _retrieve_pg_stats(self, pg_stats: List[PgStatTable]) -> Dict[str, int]:
         results: Dict[str, int] = {}
 
-        with self.pg.connect().cursor() as cur:
-            for pg_stat in pg_stats:
-                cur.execute(pg_stat.query)
-                row = cur.fetchone()
-                assert len(row) == len(pg_stat.columns)
+        with closing(self.pg.connect()) as conn:
+            with conn.cursor() as cur:
+                for pg_stat in pg_stats:
+                    cur.execute(pg_stat.query)
+                    row = cur.fetchone()
+                    assert len(row) == len(pg_stat.columns)
 
-                for col, val in zip(pg_stat.columns, row):
-                    results[f"{pg_stat.table}.{col}"] = int(val)
+                    for col, val in zip(pg_stat.columns, row):
+                        results[f"{pg_stat.table}.{col}"] = int(val)
 
         return results
 
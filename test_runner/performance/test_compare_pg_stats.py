@@ -22,13 +22,14 @@ def test_compare_pg_stats_rw_with_pgbench_default(neon_with_baseline: PgCompare,
                                                   duration: int,
                                                   pg_stats_rw: List[PgStatTable]):
     env = neon_with_baseline
+    connstr = env.pg.connstr()
     # initialize pgbench
-    env.pg_bin.run_capture(['pgbench', f'-s{scale}', '-i', env.pg.connstr()])
+    env.pg_bin.run_capture(['pgbench', f'-s{scale}', '-i', connstr])
     env.flush()
 
     with env.record_pg_stats(pg_stats_rw):
         env.pg_bin.run_capture(
-            ['pgbench', f'-T{duration}', f'--random-seed={seed}', '-Mprepared', env.pg.connstr()])
+            ['pgbench', f'-T{duration}', f'--random-seed={seed}', '-Mprepared', connstr])
         env.flush()
 
 
@@ -41,19 +42,14 @@ def test_compare_pg_stats_wo_with_pgbench_simple_update(neon_with_baseline: PgCo
                                                         duration: int,
                                                         pg_stats_wo: List[PgStatTable]):
     env = neon_with_baseline
+    connstr = env.pg.connstr()
     # initialize pgbench
-    env.pg_bin.run_capture(['pgbench', f'-s{scale}', '-i', env.pg.connstr()])
+    env.pg_bin.run_capture(['pgbench', f'-s{scale}', '-i', connstr])
     env.flush()
 
     with env.record_pg_stats(pg_stats_wo):
-        env.pg_bin.run_capture([
-            'pgbench',
-            '-N',
-            f'-T{duration}',
-            f'--random-seed={seed}',
-            '-Mprepared',
-            env.pg.connstr()
-        ])
+        env.pg_bin.run_capture(
+            ['pgbench', '-N', f'-T{duration}', f'--random-seed={seed}', '-Mprepared', connstr])
         env.flush()
 
 
@@ -66,19 +62,14 @@ def test_compare_pg_stats_ro_with_pgbench_select_only(neon_with_baseline: PgComp
                                                       duration: int,
                                                       pg_stats_ro: List[PgStatTable]):
     env = neon_with_baseline
+    connstr = env.pg.connstr()
     # initialize pgbench
-    env.pg_bin.run_capture(['pgbench', f'-s{scale}', '-i', env.pg.connstr()])
+    env.pg_bin.run_capture(['pgbench', f'-s{scale}', '-i', connstr])
     env.flush()
 
     with env.record_pg_stats(pg_stats_ro):
-        env.pg_bin.run_capture([
-            'pgbench',
-            '-S',
-            f'-T{duration}',
-            f'--random-seed={seed}',
-            '-Mprepared',
-            env.pg.connstr()
-        ])
+        env.pg_bin.run_capture(
+            ['pgbench', '-S', f'-T{duration}', f'--random-seed={seed}', '-Mprepared', connstr])
         env.flush()
 
 
@@ -91,11 +82,12 @@ def test_compare_pg_stats_wal_with_pgbench_default(neon_with_baseline: PgCompare
                                                    duration: int,
                                                    pg_stats_wal: List[PgStatTable]):
     env = neon_with_baseline
+    connstr = env.pg.connstr()
     # initialize pgbench
-    env.pg_bin.run_capture(['pgbench', f'-s{scale}', '-i', env.pg.connstr()])
+    env.pg_bin.run_capture(['pgbench', f'-s{scale}', '-i', connstr])
     env.flush()
 
     with env.record_pg_stats(pg_stats_wal):
         env.pg_bin.run_capture(
-            ['pgbench', f'-T{duration}', f'--random-seed={seed}', '-Mprepared', env.pg.connstr()])
+            ['pgbench', f'-T{duration}', f'--random-seed={seed}', '-Mprepared', connstr])
         env.flush()
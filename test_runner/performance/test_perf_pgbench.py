@@ -72,19 +72,21 @@ def run_pgbench(env: PgCompare, prefix: str, cmdline):
 # Currently, the # of connections is hardcoded at 4
 def run_test_pgbench(env: PgCompare, scale: int, duration: int):
 
+    connstr = env.pg.connstr()
+
     # Record the scale and initialize
     env.zenbenchmark.record("scale", scale, '', MetricReport.TEST_PARAM)
-    init_pgbench(env, ['pgbench', f'-s{scale}', '-i', env.pg.connstr()])
+    init_pgbench(env, ['pgbench', f'-s{scale}', '-i', connstr])
 
     # Run simple-update workload
     run_pgbench(env,
                 "simple-update",
-                ['pgbench', '-N', '-c4', f'-T{duration}', '-P2', '-Mprepared', env.pg.connstr()])
+                ['pgbench', '-N', '-c4', f'-T{duration}', '-P2', '-Mprepared', connstr])
 
     # Run SELECT workload
     run_pgbench(env,
                 "select-only",
-                ['pgbench', '-S', '-c4', f'-T{duration}', '-P2', '-Mprepared', env.pg.connstr()])
+                ['pgbench', '-S', '-c4', f'-T{duration}', '-P2', '-Mprepared', connstr])
 
     env.report_size()
 